@@ -1,4 +1,5 @@
 use nxsh_ui::theme_validator::ThemeValidator;
+use rayon::prelude::*;
 use std::fs;
 use std::path::PathBuf;
 
@@ -85,15 +86,21 @@ fn main() -> anyhow::Result<()> {
     }
     let mut rows: Vec<Row> = Vec::new();
 
+    // 各テーマは独立しているので並列に検証し、出力は元の順序で行う
+    let outcomes: Vec<_> = theme_files
+        .par_iter()
+        .map(|entry| validator.validate_theme_file(entry.path()))
+        .collect();
+
     let mut invalid_themes = 0usize;
-    for entry in theme_files {
+    for (entry, outcome) in theme_files.iter().zip(outcomes) {
         let path = entry.path();
         let theme_name = path.file_stem().unwrap().to_string_lossy();
         total_themes += 1;
 
         print!("📄 {theme_name} ... ");
 
-        match validator.validate_theme_file(&path) {
+        match outcome {
             Ok(result) => {
                 if result.is_valid() {
                     if result.has_warnings() {
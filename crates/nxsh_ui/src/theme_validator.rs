@@ -22,15 +22,20 @@ impl ThemeValidator {
 
     /// Validate a theme file against the schema
     pub fn validate_theme_file<P: AsRef<Path>>(&self, theme_path: P) -> Result<ValidationResult> {
-        let theme_content = fs::read_to_string(&theme_path).with_context(|| {
+        let theme_content = fs::read(&theme_path).with_context(|| {
             format!(
                 "Failed to read theme file: {}",
                 theme_path.as_ref().display()
             )
         })?;
 
-        let theme_value: Value =
-            serde_json::from_str(&theme_content).context("Failed to parse theme JSON")?;
+        // Parse straight from bytes; serde_json validates UTF-8 while parsing
+        let theme_value: Value = serde_json::from_slice(&theme_content).with_context(|| {
+            format!(
+                "Failed to parse theme JSON: {}",
+                theme_path.as_ref().display()
+            )
+        })?;
 
         self.validate_theme_value(&theme_value)
     }
@@ -93,13 +98,14 @@ impl ThemeValidator {
                         .push(format!("Missing required color: '{}'", color_name));
                 }
             }
-            // Keep any additional color keys as well if valid
+            // Keep any additional color keys as well if valid; required ones are already in the map
             for (k, v) in colors.iter() {
+                if color_hex_map.contains_key(k) {
+                    continue;
+                }
                 if let Some(hex) = v.as_str() {
                     if Self::is_valid_hex_color(hex) {
-                        color_hex_map
-                            .entry(k.to_string())
-                            .or_insert_with(|| hex.to_string());
+                        color_hex_map.insert(k.to_string(), hex.to_string());
                     }
                 }
             }
@@ -177,11 +183,10 @@ impl ThemeValidator {
 
     /// Check if a string is a valid hex color
     fn is_valid_hex_color(color: &str) -> bool {
-        if color.len() != 7 || !color.starts_with('#') {
-            return false;
+        match color.as_bytes() {
+            [b'#', digits @ ..] if digits.len() == 6 => digits.iter().all(u8::is_ascii_hexdigit),
+            _ => false,
         }
-
-        color[1..].chars().all(|c| c.is_ascii_hexdigit())
     }
 
     // Resolve a color reference, accepting #RRGGBB, named basic colors, or keys from colors map